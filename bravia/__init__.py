@@ -3,6 +3,7 @@ from .app_control import AppControl
 from .audio import AudioControl
 from .av_content import AvContent
 from .video import Video
+from .utils import BraviaError
 from .__version__ import (
     __title__,
     __description__,
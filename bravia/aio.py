@@ -0,0 +1,890 @@
+"""
+bravia.aio
+~~~~~~~~~~
+
+Asynchronous variant of :class:`Bravia` built on ``aiohttp``.
+
+Independent calls can be awaited concurrently with :func:`asyncio.gather`
+instead of paying one round trip after another.
+"""
+
+import asyncio
+from itertools import count
+from random import randint
+from typing import AsyncIterator, Dict, List, Optional, Tuple, Union
+
+import aiohttp
+
+from .bravia import _API_SERVICES, _READS, _SERVICES, _SNAPSHOT, _STATUS_TRUE
+from .utils import (
+    BraviaError,
+    build_envelope,
+    encode_request,
+    group_calls,
+    loads,
+    parse_batch,
+    parse_result,
+)
+
+# Names of the reads in bulk_status, see _READS.
+_BULK_STATUS = (
+    "system_info",
+    "network_settings",
+    "interface_information",
+    "power_status",
+    "led_status",
+    "supported_functions",
+    "content_list",
+    "content_count",
+    "volume_info",
+    "sound_settings",
+)
+
+
+def _new_session(
+    pre_shared_key: Optional[str],
+    timeout: Union[float, Tuple[float, float]],
+    limit_per_host: int = 8,
+) -> aiohttp.ClientSession:
+    """
+    Create a client session for talking to TVs. ``aiohttp``
+    sessions must be created inside a running event loop.
+
+    :rtype: :class:`aiohttp.ClientSession`
+    """
+
+    if isinstance(timeout, tuple):
+        connect, read = timeout
+        client_timeout = aiohttp.ClientTimeout(sock_connect=connect, sock_read=read)
+    else:
+        client_timeout = aiohttp.ClientTimeout(total=timeout)
+
+    headers = {
+        "Content-Type": "application/json",
+        "Connection": "keep-alive",
+    }
+
+    if pre_shared_key:
+        headers["X-Auth-PSK"] = pre_shared_key
+
+    return aiohttp.ClientSession(
+        headers=headers,
+        connector=aiohttp.TCPConnector(
+            limit=0, limit_per_host=limit_per_host, keepalive_timeout=75
+        ),
+        timeout=client_timeout,
+    )
+
+
+class AsyncBravia:
+    """
+    Asynchronous counterpart of :class:`Bravia` for the
+    ``system`` service. Properties of :class:`Bravia` are
+    coroutine methods here. The other services have their
+    own subclasses, e.g. :class:`AsyncAudioControl`, and
+    :meth:`call` reaches any method.
+
+    :param ip: IP address of the device
+    :type ip: :class:`str`
+    :param pre_shared_key: Pre-shared key configured on TV, defaults to
+        :class:`None`
+    :type pre_shared_key: :class:`Optional[str]`
+    :param timeout: Connect and read timeout in seconds, defaults to
+        :class:`(3.05, 10)`
+    :type timeout: :class:`Union[float, Tuple[float, float]]`
+
+    Usage:
+
+    >>> from bravia.aio import AsyncBravia, gather_status
+    >>> async with AsyncBravia(ip='192.168.1.25') as b:
+    ...     status = await gather_status(b)
+    """
+
+    __slots__ = (
+        "base_url",
+        "pre_shared_key",
+        "timeout",
+        "_urls",
+        "_session",
+        "_owns_session",
+        "_id_iter",
+    )
+
+    def __init__(
+        self,
+        ip: str,
+        pre_shared_key: Optional[str] = None,
+        timeout: Union[float, Tuple[float, float]] = (3.05, 10),
+    ):
+        self.base_url = f"http://{ip}/sony"
+        self._urls = {s: f"{self.base_url}/{s}" for s in _SERVICES}
+        self.pre_shared_key = pre_shared_key
+        self.timeout = timeout
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._owns_session = True
+        self._id_iter = count(randint(1, 1 << 20))
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Create the client session on first use. ``aiohttp`` sessions
+        must be created inside a running event loop.
+
+        :rtype: :class:`aiohttp.ClientSession`
+        """
+
+        if self._owns_session and (self._session is None or self._session.closed):
+            self._session = _new_session(self.pre_shared_key, self.timeout)
+
+        return self._session
+
+    @classmethod
+    def from_session(
+        cls, ip: str, session: aiohttp.ClientSession, **kwargs
+    ) -> "AsyncBravia":
+        r"""
+        Create an instance that sends its requests over an
+        existing session, e.g. one shared by many TVs. The
+        session is not closed by :meth:`close`, and its headers
+        are sent as they are.
+
+        :param ip: IP address of the device
+        :type ip: :class:`str`
+        :param session: Session to use
+        :type session: :class:`aiohttp.ClientSession`
+        :param \*\*kwargs: Other arguments that :class:`AsyncBravia` takes
+
+        :rtype: :class:`AsyncBravia`
+        """
+
+        tv = cls(ip, **kwargs)
+        tv._session = session
+        tv._owns_session = False
+
+        return tv
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
+
+    async def prewarm(self) -> None:
+        """
+        See :meth:`Bravia.prewarm`. Can be scheduled with
+        :func:`asyncio.create_task` so it does not hold up the caller.
+        """
+
+        try:
+            await self.interface_information()
+        except Exception:
+            pass
+
+    async def close(self) -> None:
+        """
+        Close the underlying client session and its pooled connections.
+        """
+
+        if self._owns_session and self._session is not None:
+            await self._session.close()
+
+    async def _get(self, params: dict, service: str) -> List[dict]:
+        """
+        Get data for the specified service and method.
+
+        :param params: Parameters for the request
+        :type params: :class:`dict`
+        :param service: Name of the service
+        :type service: :class:`str`
+
+        :rtype: List[dict]
+        """
+
+        url = self._urls.get(service) or f"{self.base_url}/{service}"
+
+        async with self._get_session().post(url, data=encode_request(params)) as r:
+            body = loads(await r.read())
+
+        return parse_result(r.status, body)
+
+    _set = _get
+
+    async def call(
+        self,
+        service: str,
+        method: str,
+        params: Optional[list] = None,
+        version: str = "1.0",
+    ) -> List[dict]:
+        """
+        Call any method of any service. Use it for methods that
+        have no coroutine of their own.
+
+        :param service: Name of the service
+        :type service: :class:`str`
+        :param method: Name of the method
+        :type method: :class:`str`
+        :param params: Optionally provided params, defaults to :class:`[]`
+        :type params: :class:`Optional[list]`
+        :param version: Version of the method to use, defaults to 1.0
+        :type version: :class:`str`
+
+        :rtype: List[dict]
+
+        Usage:
+
+        >>> await b.call("audio", "getVolumeInformation")
+        """
+
+        prepared_params = self.build_params(
+            method=method, params=params, version=version
+        )
+
+        return await self._get(params=prepared_params, service=service)
+
+    async def subscribe(
+        self, service: str, notifications: Optional[List[str]] = None
+    ) -> AsyncIterator[dict]:
+        """
+        Switch on notifications of a service and yield them as the
+        TV pushes them over a WebSocket, instead of polling.
+
+        :param service: Name of the service, e.g. ``system`` or ``audio``
+        :type service: :class:`str`
+        :param notifications: Names of the notifications to switch on,
+            defaults to all the service offers
+        :type notifications: :class:`Optional[List[str]]`
+
+        :return: Notification messages, e.g. ``notifyPowerStatus``
+        :rtype: AsyncIterator[dict]
+
+        Usage:
+
+        >>> async for event in b.subscribe("system", ["notifyPowerStatus"]):
+        ...     print(event["params"])
+        """
+
+        url = self._urls.get(service) or f"{self.base_url}/{service}"
+
+        async with self._get_session().ws_connect("ws" + url[4:]) as ws:
+            # Without params the TV replies with the available notifications.
+            available = await self._ws_call(ws, "switchNotifications", [{}])
+            offered = available[0].get("enabled", []) + available[0].get("disabled", [])
+            enabled = [
+                n
+                for n in offered
+                if notifications is None or n["name"] in notifications
+            ]
+            disabled = [n for n in offered if n not in enabled]
+            await self._ws_call(
+                ws, "switchNotifications", [{"enabled": enabled, "disabled": disabled}]
+            )
+
+            async for msg in ws:
+                if msg.type != aiohttp.WSMsgType.TEXT:
+                    break
+
+                data = loads(msg.data)
+
+                if "method" in data:
+                    yield data
+
+    async def _ws_call(
+        self, ws: aiohttp.ClientWebSocketResponse, method: str, params: list
+    ) -> List[dict]:
+        """
+        Send a request over a notification WebSocket and wait for
+        its response.
+
+        :param ws: Open WebSocket of a service
+        :type ws: :class:`aiohttp.ClientWebSocketResponse`
+        :param method: Name of the method
+        :type method: :class:`str`
+        :param params: Parameters of the method
+        :type params: :class:`list`
+
+        :raises BraviaError: If the TV returns an error
+
+        :rtype: List[dict]
+        """
+
+        body = self.build_params(method=method, params=params)
+        await ws.send_str(encode_request(body).decode())
+
+        while True:
+            msg = await ws.receive()
+
+            if msg.type != aiohttp.WSMsgType.TEXT:
+                raise ConnectionError(f"WebSocket closed before {method} returned.")
+
+            data = loads(msg.data)
+
+            if data.get("id") != body["id"]:
+                continue
+
+            if "error" in data:
+                raise BraviaError(200, data["error"])
+
+            return data.get("result", [])
+
+    async def poll(
+        self, specs: List[tuple], interval: float
+    ) -> AsyncIterator[Dict[str, List[dict]]]:
+        """
+        Call the given methods every ``interval`` seconds over
+        the same session and yield their results.
+
+        :param specs: ``(service, method)`` tuples, optionally followed
+            by the params and version of the method as in :meth:`batch`
+        :type specs: :class:`List[tuple]`
+        :param interval: Seconds between the start of two polls
+        :type interval: :class:`float`
+
+        :raises ValueError: If a method name is given more than once
+
+        :return: Results keyed by method name, once per poll
+        :rtype: AsyncIterator[Dict[str, List[dict]]]
+
+        Usage:
+
+        >>> async for status in b.poll([("system", "getPowerStatus")], 1):
+        ...     print(status["getPowerStatus"])
+        """
+
+        methods = [spec[1] for spec in specs]
+
+        if len(set(methods)) != len(methods):
+            raise ValueError("Results are keyed by method name, poll each method once.")
+
+        loop = asyncio.get_running_loop()
+        next_poll = loop.time()
+
+        while True:
+            results = await asyncio.gather(*(self.call(*spec) for spec in specs))
+            yield dict(zip(methods, results))
+
+            next_poll += interval
+            await asyncio.sleep(max(0, next_poll - loop.time()))
+
+    async def bulk_status(self) -> Dict[str, List[dict]]:
+        """
+        Read system, input and audio status concurrently. The
+        keys match the property names of the sync classes, e.g.
+        ``system_info``, ``content_list`` and ``volume_info``.
+
+        :return: Results keyed by name
+        :rtype: Dict[str, List[dict]]
+        """
+
+        results = await asyncio.gather(
+            *(self.call(*_READS[name]) for name in _BULK_STATUS)
+        )
+
+        return dict(zip(_BULK_STATUS, results))
+
+    async def batch(self, calls: List[tuple]) -> List[List[dict]]:
+        """
+        See :meth:`Bravia.batch`. The batches for different
+        services are sent concurrently.
+
+        :param calls: ``(service, method, params)`` or
+            ``(service, method, params, version)`` tuples
+        :type calls: :class:`List[tuple]`
+
+        :return: The result or error of each call, in the order given
+        :rtype: List[List[dict]]
+        """
+
+        grouped, ids = group_calls(calls, self.build_params)
+        results: Dict[int, List[dict]] = {}
+
+        for batch_results in await asyncio.gather(
+            *(self._post_batch(bodies, service) for service, bodies in grouped.items())
+        ):
+            results.update(batch_results)
+
+        return [results.get(tx_id, []) for tx_id in ids]
+
+    async def _post_batch(
+        self, bodies: List[dict], service: str
+    ) -> Dict[int, List[dict]]:
+        """
+        Post one JSON-RPC batch to a service.
+
+        :param bodies: Request bodies
+        :type bodies: :class:`List[dict]`
+        :param service: Name of the service
+        :type service: :class:`str`
+
+        :return: The result or error of each request, keyed by id
+        :rtype: Dict[int, List[dict]]
+        """
+
+        url = self._urls.get(service) or f"{self.base_url}/{service}"
+
+        async with self._get_session().post(url, data=encode_request(bodies)) as r:
+            data = loads(await r.read())
+
+        return parse_batch(r.status, data, bodies)
+
+    async def system_snapshot(self) -> Dict[str, List[dict]]:
+        """
+        See :meth:`Bravia.system_snapshot`.
+
+        :return: Results keyed by method name
+        :rtype: Dict[str, List[dict]]
+        """
+
+        results = await self.batch(_SNAPSHOT)
+
+        return {call[1]: result for call, result in zip(_SNAPSHOT, results)}
+
+    def build_params(
+        self, method: str, version: Optional[str] = "1.0", params: Optional[list] = None
+    ) -> dict:
+        """
+        Build request parameters.
+
+        :param method: Name of the method
+        :type method: :class:`str`
+        :param params: Optionally provided params, defaults to :class:`[]`
+        :type params: :class:`Optional[list]`
+        :param version: Version of the method to use, defaults to 1.0
+        :type version: :class`dict`
+
+        :return: Dictionary of request parameters
+        :rtype: :class:`dict`
+        """
+
+        return build_envelope(method, self._rand_id(), params, version)
+
+    def _rand_id(self) -> int:
+        """
+        See :meth:`Bravia._rand_id`.
+
+        :return: Integer in the range 1 to 2147483647
+        :rtype: int
+        """
+
+        return next(self._id_iter) & 0x7FFFFFFF
+
+    async def api_info(self, service=None) -> List[dict]:
+        """
+        Get the available services and their
+        API methods.
+
+        :param service: Service name, defaults to all
+        :type service: :class:`str`
+
+        :rtype: List[dict]
+        """
+
+        services = [{"services": [service] if service else list(_API_SERVICES)}]
+
+        prepared_params = self.build_params(
+            method="getSupportedApiInfo", params=services, version="1.0"
+        )
+
+        return await self._get(params=prepared_params, service="guide")
+
+    async def wol_mode(self) -> List[dict]:
+        """
+        Get the Wake on LAN mode.
+
+        :rtype: List[dict]
+        """
+
+        return await self.call(*_READS["wol_mode"])
+
+    async def set_wol_mode(self, mode: bool) -> List[dict]:
+        """
+        Set the Wake on LAN mode.
+
+        :param mode: True or False
+        :type mode: :class:`bool`
+
+        :rtype: List[dict]
+        """
+
+        prepared_params = self.build_params(
+            method="setWolMode", params=[{"enabled": mode}]
+        )
+
+        return await self._set(params=prepared_params, service="system")
+
+    async def system_info(self) -> List[dict]:
+        """
+        Get system information.
+
+        :rtype: List[dict]
+        """
+
+        return await self.call(*_READS["system_info"])
+
+    async def network_settings(self) -> List[dict]:
+        """
+        Get network information.
+
+        :rtype: List[dict]
+        """
+
+        return await self.call(*_READS["network_settings"])
+
+    async def interface_information(self) -> List[dict]:
+        """
+        Get interface information.
+
+        :rtype: List[dict]
+        """
+
+        return await self.call(*_READS["interface_information"])
+
+    async def power_status(self) -> List[dict]:
+        """
+        Get the power status of the TV.
+
+        :rtype: List[dict]
+        """
+
+        return await self.call(*_READS["power_status"])
+
+    async def supported_functions(self) -> List[dict]:
+        """
+        Get the supported functions of the device.
+
+        :rtype: List[dict]
+        """
+
+        return await self.call(*_READS["supported_functions"])
+
+    async def set_power_status(self, status: Union[bool, str]) -> List[dict]:
+        """
+        Power the TV on or off. See :meth:`Bravia.set_power_status`.
+
+        :param status: Requested power state
+        :type status: :class:`Union[bool, str]`
+
+        :rtype: List[dict]
+        """
+
+        prepared_params = self.build_params(
+            method="setPowerStatus",
+            params=[{"status": status in _STATUS_TRUE}],
+        )
+
+        return await self._set(params=prepared_params, service="system")
+
+    async def power_on(self) -> List[dict]:
+        """
+        Power on the TV.
+
+        :rtype: List[dict]
+        """
+
+        return await self.set_power_status(True)
+
+    async def power_off(self) -> List[dict]:
+        """
+        Power off the TV.
+
+        :rtype: List[dict]
+        """
+
+        return await self.set_power_status(False)
+
+    async def power_saving_mode(self) -> List[dict]:
+        """
+        Get the power saving mode.
+
+        :rtype: List[dict]
+        """
+
+        return await self.call(*_READS["power_saving_mode"])
+
+    async def set_power_saving_mode(self, mode: str) -> List[dict]:
+        """
+        Set the power saving mode. See :meth:`Bravia.set_power_saving_mode`
+        for the available options.
+
+        :param mode: Power saving mode
+        :type mode: :class:`str`
+
+        :rtype: List[dict]
+        """
+
+        prepared_params = self.build_params(
+            method="setPowerSavingMode",
+            params=[{"mode": mode}],
+        )
+
+        return await self._set(params=prepared_params, service="system")
+
+    async def led_status(self) -> List[dict]:
+        """
+        Get the LED indicator status.
+
+        :rtype: List[dict]
+        """
+
+        return await self.call(*_READS["led_status"])
+
+    async def set_led_status(self, mode: str, status: bool) -> List[dict]:
+        """
+        Set the LED indicator mode. See :meth:`Bravia.set_led_status`
+        for the available options.
+
+        :param mode: LED mode
+        :type mode: :class:`str`
+        :param status: True or False.
+        :type status: :class:`bool`
+
+        :rtype: List[dict]
+        """
+
+        prepared_params = self.build_params(
+            method="setLEDIndicatorStatus",
+            params=[{"mode": mode, "status": status}],
+            version="1.1",
+        )
+
+        return await self._set(params=prepared_params, service="system")
+
+    async def set_language(self, lang: str = "eng") -> List[dict]:
+        """
+        Set the language of the TV. This setting
+        is region specific.
+
+        :param lang: Set the language, defaults to :class:`eng`
+        :type lang: :class:`str`
+
+        :rtype: List[dict]
+        """
+
+        prepared_params = self.build_params(
+            method="setLanguage",
+            params=[{"language": lang}],
+        )
+
+        return await self._set(params=prepared_params, service="system")
+
+    async def reboot(self) -> List[dict]:
+        """
+        Reboot the TV.
+
+        :rtype: List[dict]
+        """
+
+        prepared_params = self.build_params(method="requestReboot")
+
+        return await self._set(params=prepared_params, service="system")
+
+
+class AsyncAppControl(AsyncBravia):
+    r"""
+    Asynchronous counterpart of :class:`AppControl`.
+
+    :param \*\*kwargs: Arguments that :class:`AsyncBravia` takes.
+    """
+
+    __slots__ = ()
+
+    async def app_list(self) -> List[dict]:
+        """
+        Get a list of applications available on the TV.
+
+        :rtype: List[dict]
+        """
+
+        return await self.call("appControl", "getApplicationList")
+
+    async def app_status(self) -> List[dict]:
+        """
+        Get the status of service(s). Defaults to all.
+
+        :rtype: List[dict]
+        """
+
+        return await self.call("appControl", "getApplicationStatusList")
+
+    async def set_active_app(self, app_uri: str) -> List[dict]:
+        """
+        Start a service that is in :meth:`app_list`.
+
+        :param app_uri: App URI
+        :type app_uri: :class:`str`
+
+        :rtype: List[dict]
+        """
+
+        return await self.call("appControl", "setActiveApp", params=[{"uri": app_uri}])
+
+    async def terminate_apps(self) -> List[dict]:
+        """
+        Terminate all apps.
+
+        :rtype: List[dict]
+        """
+
+        return await self.call("appControl", "terminateApps")
+
+
+class AsyncAudioControl(AsyncBravia):
+    r"""
+    Asynchronous counterpart of :class:`AudioControl`.
+
+    :param \*\*kwargs: Arguments that :class:`AsyncBravia` takes.
+    """
+
+    __slots__ = ()
+
+    async def sound_settings(self) -> List[dict]:
+        """
+        Get the audio settings.
+
+        :rtype: List[dict]
+        """
+
+        return await self.call(*_READS["sound_settings"])
+
+    async def speaker_settings(self) -> List[dict]:
+        """
+        Get the speaker settings.
+
+        :rtype: List[dict]
+        """
+
+        return await self.call(
+            "audio", "getSpeakerSettings", params=[{"target": "tvPosition"}]
+        )
+
+    async def volume_info(self) -> List[dict]:
+        """
+        Get information about the volume and mute status.
+
+        :rtype: List[dict]
+        """
+
+        return await self.call(*_READS["volume_info"])
+
+    async def mute(self, status: bool) -> List[dict]:
+        """
+        Set mute status.
+
+        :param status: True or False
+        :type status: :class:`bool`
+
+        :rtype: List[dict]
+        """
+
+        return await self.call("audio", "setAudioMute", params=[{"status": status}])
+
+
+class AsyncAvContent(AsyncBravia):
+    r"""
+    Asynchronous counterpart of :class:`AvContent`.
+
+    :param \*\*kwargs: Arguments that :class:`AsyncBravia` takes.
+    """
+
+    __slots__ = ()
+
+    async def content_count(self) -> List[dict]:
+        """
+        Get the number of external inputs.
+
+        :rtype: List[dict]
+        """
+
+        return await self.call(*_READS["content_count"])
+
+    async def content_list(self) -> List[dict]:
+        """
+        Get content list.
+
+        :rtype: List[dict]
+        """
+
+        return await self.call(*_READS["content_list"])
+
+
+class AsyncVideo(AsyncBravia):
+    r"""
+    Asynchronous counterpart of :class:`Video`.
+
+    :param \*\*kwargs: Arguments that :class:`AsyncBravia` takes.
+    """
+
+    __slots__ = ()
+
+    async def picture_quality_settings(self, target: str = "") -> List[dict]:
+        """
+        Get picture quality settings.
+
+        :param target: Setting to read, defaults to all
+        :type target: :class:`str`
+
+        :rtype: List[dict]
+        """
+
+        return await self.call(
+            "video", "getPictureQualitySettings", params=[{"target": target}]
+        )
+
+
+async def gather_status(tv: AsyncBravia) -> dict:
+    """
+    Fetch the commonly polled status of a TV concurrently.
+
+    :param tv: :class:`AsyncBravia` instance
+    :type tv: :class:`AsyncBravia`
+
+    :return: Results keyed by name
+    :rtype: :class:`dict`
+    """
+
+    names = (
+        "power_status",
+        "network_settings",
+        "led_status",
+        "supported_functions",
+        "volume_info",
+        "app_list",
+    )
+    results = await asyncio.gather(
+        tv.power_status(),
+        tv.network_settings(),
+        tv.led_status(),
+        tv.supported_functions(),
+        tv.call(*_READS["volume_info"]),
+        tv.call("appControl", "getApplicationList"),
+    )
+
+    return dict(zip(names, results))
+
+
+async def gather_snapshots(
+    ips: List[str],
+    pre_shared_key: Optional[str] = None,
+    timeout: Union[float, Tuple[float, float]] = (3.05, 10),
+) -> List[Union[Dict[str, List[dict]], BaseException]]:
+    """
+    Take a :meth:`AsyncBravia.system_snapshot` of many TVs
+    at once over one shared session.
+
+    :param ips: IP addresses of the TVs
+    :type ips: :class:`List[str]`
+    :param pre_shared_key: Pre-shared key configured on every TV
+    :type pre_shared_key: :class:`Optional[str]`
+    :param timeout: Connect and read timeout in seconds, defaults to
+        :class:`(3.05, 10)`
+    :type timeout: :class:`Union[float, Tuple[float, float]]`
+
+    :return: The snapshot of each TV, or the exception raised
+        while taking it, in the order of ``ips``
+    :rtype: List[Union[Dict[str, List[dict]], BaseException]]
+    """
+
+    async with _new_session(pre_shared_key, timeout, limit_per_host=1) as session:
+        return await asyncio.gather(
+            *(AsyncBravia.from_session(ip, session).system_snapshot() for ip in ips),
+            return_exceptions=True,
+        )
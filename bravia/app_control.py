@@ -16,8 +16,7 @@ class AppControl(Bravia):
     service.
     """
 
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
+    __slots__ = ()
 
     @property
     def app_list(self) -> List[dict]:
@@ -27,10 +26,7 @@ class AppControl(Bravia):
         :rtype: List[dict]
         """
 
-        prepared_params = self.build_params(method="getApplicationList")
-        resp: List[dict] = self._get(params=prepared_params, service="appControl")
-
-        return resp
+        return self._rpc("appControl", "getApplicationList")
 
     @property
     def app_status(self) -> List[dict]:
@@ -40,10 +36,7 @@ class AppControl(Bravia):
         :rtype: List[dict]
         """
 
-        prepared_params = self.build_params(method="getApplicationStatusList")
-        resp: List[dict] = self._get(params=prepared_params, service="appControl")
-
-        return resp
+        return self._rpc("appControl", "getApplicationStatusList")
 
     def set_active_app(self, app_uri: str) -> List[dict]:
         """
@@ -55,13 +48,7 @@ class AppControl(Bravia):
         :rtype: List[dict]
         """
 
-        prepared_params = self.build_params(
-            method="setActiveApp",
-            params=[{"uri": app_uri}],
-        )
-        resp: List[dict] = self._get(params=prepared_params, service="appControl")
-
-        return resp
+        return self._rpc("appControl", "setActiveApp", params=[{"uri": app_uri}])
 
     def terminate_apps(self) -> List[dict]:
         """
@@ -70,7 +57,4 @@ class AppControl(Bravia):
         :rtype: List[dict]
         """
 
-        prepared_params = self.build_params(method="terminateApps")
-        resp: List[dict] = self._get(params=prepared_params, service="appControl")
-
-        return resp
+        return self._rpc("appControl", "terminateApps")
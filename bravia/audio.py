@@ -5,9 +5,9 @@ bravia.audio
 Module for the audio service.
 """
 
-from typing import List
+from typing import List, Union
 
-from .bravia import Bravia
+from .bravia import _READS, Bravia
 
 
 class AudioControl(Bravia):
@@ -18,8 +18,7 @@ class AudioControl(Bravia):
     :param \*\*kwargs: Arguments that :class:`Bravia` takes.
     """
 
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
+    __slots__ = ()
 
     @property
     def sound_settings(self) -> List[dict]:
@@ -29,14 +28,7 @@ class AudioControl(Bravia):
         :rtype: List[dict]
         """
 
-        prepared_params = self.build_params(
-            method="getSoundSettings",
-            params=[{"target": "outputTerminal"}],
-            version="1.1",
-        )
-        resp: List[dict] = self._get(params=prepared_params, service="audio")
-
-        return resp
+        return self._rpc(*_READS["sound_settings"])
 
     @property
     def speaker_settings(self) -> List[dict]:
@@ -46,13 +38,9 @@ class AudioControl(Bravia):
         :rtype: List[dict]
         """
 
-        prepared_params = self.build_params(
-            method="getSpeakerSettings",
-            params=[{"target": "tvPosition"}],
+        return self._rpc(
+            "audio", "getSpeakerSettings", params=[{"target": "tvPosition"}]
         )
-        resp: List[dict] = self._get(params=prepared_params, service="audio")
-
-        return resp
 
     @property
     def volume_info(self) -> List[dict]:
@@ -62,25 +50,33 @@ class AudioControl(Bravia):
         :rtype: List[dict]
         """
 
-        prepared_params = self.build_params(method="getVolumeInformation")
-        resp: List[dict] = self._get(params=prepared_params, service="audio")
-
-        return resp
+        return self._rpc(*_READS["volume_info"])
 
-    def mute(self, status: bool) -> List[dict]:
+    def mute(self, status: bool, force: bool = False) -> Union[dict, List[dict]]:
         """
-        Set mute status.
+        Set mute status. Nothing is sent if every output
+        already has that status.
 
         :param status: True or False
         :type status: :class:`bool`
+        :param force: Send the request even if every output already
+            has that status
+        :type force: :class:`bool`
 
-        :rtype: List[dict]
+        :rtype: Union[dict, List[dict]]
         """
 
         prepared_params = self.build_params(
             method="setAudioMute",
             params=[{"status": status}],
         )
-        resp: List[dict] = self._set(params=prepared_params, service="audio")
 
-        return resp
+        return self._maybe_set(
+            prepared_params,
+            service="audio",
+            getter="getVolumeInformation",
+            matches=lambda current: bool(current[0])
+            and all(t["mute"] == status for t in current[0]),
+            msg=lambda: f"Mute already set to {status}.",
+            force=force,
+        )
@@ -5,7 +5,7 @@ av_content
 Module for the avControl service.
 """
 
-from .bravia import Bravia
+from .bravia import _READS, Bravia
 
 
 class AvContent(Bravia):
@@ -16,8 +16,7 @@ class AvContent(Bravia):
     :param \*\*kwargs: Arguments that :class:`Bravia` takes.
     """
 
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
+    __slots__ = ()
 
     @property
     def content_count(self):
@@ -27,14 +26,7 @@ class AvContent(Bravia):
         :rtype:
         """
 
-        prepared_params = self.build_params(
-            method="getContentCount",
-            params=[{"source": "extInput:hdmi"}],
-            version="1.1",
-        )
-        resp = self._get(params=prepared_params, service="avContent")
-
-        return resp
+        return self._rpc(*_READS["content_count"], cached=True, ttl=60)
 
     @property
     def content_list(self):
@@ -44,11 +36,4 @@ class AvContent(Bravia):
         :rtype:
         """
 
-        prepared_params = self.build_params(
-            method="getContentList",
-            params=[{"stIdx": 0, "cnt": 50, "uri": "extInput:hdmi"}],
-            version="1.5",
-        )
-        resp = self._get(params=prepared_params, service="avContent")
-
-        return resp
+        return self._rpc(*_READS["content_list"], cached=True, ttl=60)
@@ -5,13 +5,96 @@ The bravia project was written and tested against
 the XBR-65X900H model.
 """
 
+from concurrent.futures import Future
+from contextlib import contextmanager
+from copy import deepcopy
+from itertools import count
+from threading import Lock, Thread, local
 from random import randint
-from typing import List, Optional
+from time import monotonic
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Union
 
-import requests
 from requests import Response
 
-from .utils import handle_error
+from .transport import make_session
+from .utils import (
+    ErrorResult,
+    build_envelope,
+    encode_request,
+    group_calls,
+    handle_error,
+    loads,
+    parse_batch,
+)
+
+_SERVICES = (
+    "guide",
+    "system",
+    "appControl",
+    "audio",
+    "avContent",
+    "encryption",
+    "video",
+    "videoScreen",
+)
+# Services listed by api_info when no service is given.
+_API_SERVICES = (
+    "appControl",
+    "audio",
+    "avContent",
+    "encryption",
+    "system",
+    "video",
+    "videoScreen",
+)
+_STATUS_TRUE = frozenset({True, "on", "On", "ON", "true", "True", "1"})
+
+# (service, method, params, version) of the reads offered by the
+# sync and async clients, keyed by property name.
+_READS = {
+    "system_info": ("system", "getSystemInformation", None, "1.0"),
+    "network_settings": ("system", "getNetworkSettings", [{"netif": ""}], "1.0"),
+    "interface_information": ("system", "getInterfaceInformation", None, "1.0"),
+    "power_status": ("system", "getPowerStatus", None, "1.0"),
+    "led_status": ("system", "getLEDIndicatorStatus", None, "1.0"),
+    "supported_functions": ("system", "getSystemSupportedFunction", None, "1.0"),
+    "power_saving_mode": ("system", "getPowerSavingMode", None, "1.0"),
+    "wol_mode": ("system", "getWolMode", None, "1.0"),
+    "content_count": (
+        "avContent",
+        "getContentCount",
+        [{"source": "extInput:hdmi"}],
+        "1.1",
+    ),
+    "content_list": (
+        "avContent",
+        "getContentList",
+        [{"stIdx": 0, "cnt": 50, "uri": "extInput:hdmi"}],
+        "1.5",
+    ),
+    "volume_info": ("audio", "getVolumeInformation", None, "1.0"),
+    "sound_settings": (
+        "audio",
+        "getSoundSettings",
+        [{"target": "outputTerminal"}],
+        "1.1",
+    ),
+}
+
+# Calls batched by system_snapshot.
+_SNAPSHOT = tuple(
+    _READS[name]
+    for name in (
+        "system_info",
+        "network_settings",
+        "interface_information",
+        "power_status",
+        "led_status",
+        "supported_functions",
+        "power_saving_mode",
+        "wol_mode",
+    )
+)
 
 
 class Bravia:
@@ -21,8 +104,27 @@ class Bravia:
 
     :param ip: IP address of the device
     :type ip: :class:`str`
-    :param pre_shared_key: Pre-shared key configured on TV
+    :param pre_shared_key: Pre-shared key configured on TV, defaults to
+        :class:`None`
     :type pre_shared_key: :class:`Optional[str]`
+    :param timeout: Connect and read timeout in seconds, defaults to
+        :class:`(3.05, 10)`
+    :type timeout: :class:`Union[float, Tuple[float, float]]`
+    :param cache_ttl: Seconds to keep results of lookups that rarely change,
+        such as :meth:`api_info`, defaults to :class:`300`. Shorter lived
+        results are kept for less. ``0`` disables caching.
+    :type cache_ttl: :class:`float`
+    :param transport: HTTP library to use, ``"requests"``, ``"httpx"``,
+        ``"http.client"`` or ``"pycurl"``, defaults to :class:`requests`
+    :type transport: :class:`str`
+    :param prewarm: Open the connection to the TV in a background thread
+        so the first call does not pay for the TCP handshake, defaults
+        to :class:`False`
+    :type prewarm: :class:`bool`
+    :param pool_maxsize: Connections kept open to the TV for callers
+        on several threads, ``requests`` transport only, defaults to
+        :class:`16`
+    :type pool_maxsize: :class:`int`
 
     `Sony Developer Docs <https://pro-bravia.sony.net/develop/integrate/ip-control/index.html>`_
 
@@ -31,11 +133,113 @@ class Bravia:
     >>> from bravia import Bravia
     >>> b = Bravia(ip='192.168.1.25')
     >>> b.api_info()
+
+    The underlying HTTP session keeps its connection to the TV open
+    between calls. Use the instance as a context manager, or call
+    :meth:`close`, to release it.
+
+    >>> with Bravia(ip='192.168.1.25') as b:
+    ...     b.power_status
     """
 
-    def __init__(self, ip: str, pre_shared_key: Optional[str]):
+    __slots__ = (
+        "base_url",
+        "pre_shared_key",
+        "timeout",
+        "cache_ttl",
+        "_urls",
+        "_cache",
+        "_inflight",
+        "_generation",
+        "_lock",
+        "_id_iter",
+        "_local",
+        "_session",
+    )
+
+    def __init__(
+        self,
+        ip: str,
+        pre_shared_key: Optional[str] = None,
+        timeout: Union[float, Tuple[float, float]] = (3.05, 10),
+        cache_ttl: float = 300,
+        transport: str = "requests",
+        prewarm: bool = False,
+        pool_maxsize: int = 16,
+    ):
         self.base_url = f"http://{ip}/sony"
-        self.pre_shared_key = pre_shared_key if pre_shared_key else None
+        self._urls = {s: f"{self.base_url}/{s}" for s in _SERVICES}
+        self.pre_shared_key = pre_shared_key
+        self.timeout = timeout
+        self.cache_ttl = cache_ttl
+        self._cache: Dict[tuple, Tuple[float, List[dict]]] = {}
+        self._inflight: Dict[tuple, Future] = {}
+        self._generation = 0
+        self._lock = Lock()
+        self._id_iter = count(randint(1, 1 << 20))
+        self._local = local()
+        self._session = make_session(transport, pool_maxsize=pool_maxsize)
+
+        if self.pre_shared_key:
+            self._session.headers["X-Auth-PSK"] = self.pre_shared_key
+
+        if prewarm:
+            Thread(target=self.prewarm, daemon=True).start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self) -> None:
+        """
+        Close the underlying HTTP session and its pooled connections.
+        """
+
+        self._session.close()
+
+    def prewarm(self) -> None:
+        """
+        Make a cheap call so that the session holds an open
+        connection before the first real call. Errors are
+        ignored, the TV may still be starting up. The call
+        bypasses the cache so that nothing read during warm-up
+        is served later.
+        """
+
+        try:
+            self._rpc("system", "getInterfaceInformation")
+        except Exception:
+            pass
+
+    @property
+    def _pending(self) -> Optional[Dict[str, List[Tuple[dict, Future]]]]:
+        """
+        Requests queued by the :meth:`batched` block of the
+        current thread, or None outside of one.
+        """
+
+        return getattr(self._local, "pending", None)
+
+    def _post(self, params: Union[dict, List[dict]], service: str) -> Response:
+        """
+        Post a JSON-RPC request, or a batch of requests,
+        to the given service.
+
+        :param params: Request body or list of request bodies
+        :type params: :class:`Union[dict, List[dict]]`
+        :param service: Name of the service
+        :type service: :class:`str`
+
+        :rtype: :class:`Response`
+        """
+
+        url = self._urls.get(service) or f"{self.base_url}/{service}"
+
+        return self._session.post(
+            url, data=encode_request(params), timeout=self.timeout
+        )
 
     def _get(self, params: dict, service: str) -> List[dict]:
         """
@@ -49,13 +253,10 @@ class Bravia:
         :rtype: List[dict]
         """
 
-        url = f"{self.base_url}/{service}"
-        headers = {}
+        if self._pending is not None:
+            return self._enqueue(params=params, service=service)
 
-        if self.pre_shared_key:
-            headers = {"X-Auth-PSK": f"{self.pre_shared_key}"}
-
-        resp: Response = requests.post(url, json=params, headers=headers)
+        resp: Response = self._post(params=params, service=service)
 
         return handle_error(resp)
 
@@ -71,18 +272,201 @@ class Bravia:
         :rtype: List[dict]
         """
 
-        url = f"{self.base_url}/{service}"
-        headers = {}
-
-        if self.pre_shared_key:
-            headers = {"X-Auth-PSK": f"{self.pre_shared_key}"}
+        if self._pending is not None:
+            return self._enqueue(params=params, service=service)
 
-        resp: Response = requests.post(url, json=params, headers=headers)
+        resp: Response = self._post(params=params, service=service)
 
         return handle_error(resp)
 
+    def _rpc(
+        self,
+        service: str,
+        method: str,
+        params: Optional[list] = None,
+        version: str = "1.0",
+        cached: bool = False,
+        ttl: Optional[float] = None,
+    ) -> List[dict]:
+        """
+        Call a method of a service and return its result.
+
+        :param service: Name of the service
+        :type service: :class:`str`
+        :param method: Name of the method
+        :type method: :class:`str`
+        :param params: Optionally provided params, defaults to :class:`[]`
+        :type params: :class:`Optional[list]`
+        :param version: Version of the method to use, defaults to 1.0
+        :type version: :class:`str`
+        :param cached: Serve the result from the cache, see :meth:`_cached_get`
+        :type cached: :class:`bool`
+        :param ttl: Seconds to cache the result, defaults to :attr:`cache_ttl`
+        :type ttl: :class:`Optional[float]`
+
+        :rtype: List[dict]
+        """
+
+        prepared_params = self.build_params(
+            method=method, params=params, version=version
+        )
+
+        if cached:
+            return self._cached_get(params=prepared_params, service=service, ttl=ttl)
+
+        return self._get(params=prepared_params, service=service)
+
+    def _cached_get(
+        self, params: dict, service: str, ttl: Optional[float] = None
+    ) -> List[dict]:
+        """
+        Same as :meth:`_get`, but results are kept for ``ttl``
+        seconds, at most :attr:`cache_ttl`. Errors are not kept.
+        Threads asking for a result that is being fetched wait
+        for that request instead of sending their own. Every
+        caller gets its own copy of the result, so changing it
+        does not change what later calls return.
+
+        :param params: Parameters for the request
+        :type params: :class:`dict`
+        :param service: Name of the service
+        :type service: :class:`str`
+        :param ttl: Seconds to keep the result, defaults to :attr:`cache_ttl`
+        :type ttl: :class:`Optional[float]`
+
+        :rtype: List[dict]
+        """
+
+        if self._pending is not None:
+            return self._get(params=params, service=service)
+
+        key = (service, params["method"], params["version"], repr(params["params"]))
+
+        with self._lock:
+            hit = self._cache.get(key)
+
+            if hit and hit[0] > monotonic():
+                return deepcopy(hit[1])
+
+            # Another thread is already fetching this result, wait for it.
+            fut = self._inflight.get(key)
+            waiting = fut is not None
+
+            if not waiting:
+                fut = self._inflight[key] = Future()
+
+            generation = self._generation
+
+        if waiting:
+            return deepcopy(fut.result())
+
+        try:
+            resp = self._get(params=params, service=service)
+        except BaseException as exc:
+            with self._lock:
+                if self._inflight.get(key) is fut:
+                    del self._inflight[key]
+
+            fut.set_exception(exc)
+            raise
+
+        ttl = self.cache_ttl if ttl is None else min(ttl, self.cache_ttl)
+        # Kept for the cache and waiting threads, the caller owns resp.
+        stored = deepcopy(resp)
+
+        with self._lock:
+            # Errors, e.g. from a TV that is still starting up, are not
+            # kept, nor are results read before the cache was invalidated.
+            if not isinstance(resp, ErrorResult) and generation == self._generation:
+                self._cache[key] = (monotonic() + ttl, stored)
+
+            if self._inflight.get(key) is fut:
+                del self._inflight[key]
+
+        fut.set_result(stored)
+
+        return resp
+
+    def invalidate_cache(self) -> None:
+        """
+        Drop cached results. Called after requests that change
+        the state of the TV, and useful after a firmware update.
+        Requests already in flight do not store their result.
+        """
+
+        with self._lock:
+            self._generation += 1
+            self._cache.clear()
+            self._inflight.clear()
+
+    def _forget(self, service: str, method: str) -> None:
+        """
+        Drop cached results of one method.
+
+        :param service: Name of the service
+        :type service: :class:`str`
+        :param method: Name of the method
+        :type method: :class:`str`
+        """
+
+        with self._lock:
+            self._generation += 1
+
+            for entries in (self._cache, self._inflight):
+                for key in [key for key in entries if key[:2] == (service, method)]:
+                    del entries[key]
+
+    def _maybe_set(
+        self,
+        params: dict,
+        service: str,
+        getter: str,
+        matches: Callable[[List[dict]], bool],
+        msg: Callable[[], str],
+        force: bool = False,
+    ) -> Union[dict, List[dict]]:
+        """
+        Send a set request unless the TV is already in the
+        requested state. The current state is read with
+        ``getter`` through a cache that lives for two seconds,
+        so repeated sets do not read it every time.
+
+        :param params: Parameters for the set request
+        :type params: :class:`dict`
+        :param service: Name of the service
+        :type service: :class:`str`
+        :param getter: Method that reads the current state
+        :type getter: :class:`str`
+        :param matches: Returns True if the result of ``getter`` already
+            is the requested state
+        :type matches: :class:`Callable[[List[dict]], bool]`
+        :param msg: Builds the message returned when nothing was sent
+        :type msg: :class:`Callable[[], str]`
+        :param force: Send the request without reading the state first
+        :type force: :class:`bool`
+
+        :rtype: Union[dict, List[dict]]
+        """
+
+        if not force and self._pending is None:
+            current = self._rpc(service, getter, cached=True, ttl=2)
+
+            try:
+                done = matches(current)
+            except (LookupError, TypeError, AttributeError):
+                # Unexpected or error result, send the request.
+                done = False
+
+            if done:
+                return {"msg": msg()}
+
+        resp: List[dict] = self._set(params=params, service=service)
+        self._forget(service, getter)
+
+        return resp
+
     def build_params(
-        self, method: str, version: Optional[str] = "1.0", params: Optional[list] = []
+        self, method: str, version: Optional[str] = "1.0", params: Optional[list] = None
     ) -> dict:
         """
         Build request parameters.
@@ -98,14 +482,159 @@ class Bravia:
         :rtype: :class:`dict`
         """
 
-        body = {
-            "method": method,
-            "id": self._rand_id(),
-            "params": params,
-            "version": version,
-        }
+        return build_envelope(method, self._rand_id(), params, version)
 
-        return body
+    def batch(self, calls: List[tuple]) -> List[List[dict]]:
+        """
+        Send several calls as JSON-RPC batches, one HTTP
+        request per service.
+
+        :param calls: ``(service, method, params)`` or
+            ``(service, method, params, version)`` tuples, the
+            version defaults to 1.0
+        :type calls: :class:`List[tuple]`
+
+        :return: The result or error of each call, in the order given
+        :rtype: List[List[dict]]
+
+        Usage:
+
+        >>> b.batch([("system", "getPowerStatus", []), ("audio", "getVolumeInformation", [])])
+        """
+
+        grouped, ids = group_calls(calls, self.build_params)
+        results = self._post_batches(grouped)
+
+        return [results.get(tx_id, []) for tx_id in ids]
+
+    def _post_batches(self, grouped: Dict[str, List[dict]]) -> Dict[int, List[dict]]:
+        """
+        Post one JSON-RPC batch per service.
+
+        :param grouped: Request bodies keyed by service
+        :type grouped: :class:`Dict[str, List[dict]]`
+
+        :return: The result or error of each request, keyed by id
+        :rtype: Dict[int, List[dict]]
+        """
+
+        results: Dict[int, List[dict]] = {}
+
+        for service, bodies in grouped.items():
+            resp: Response = self._post(params=bodies, service=service)
+            results.update(parse_batch(resp.status_code, loads(resp.content), bodies))
+
+        return results
+
+    def _enqueue(self, params: dict, service: str) -> Future:
+        """
+        Queue a request until the enclosing :meth:`batched`
+        block exits.
+
+        :param params: Parameters for the request
+        :type params: :class:`dict`
+        :param service: Name of the service
+        :type service: :class:`str`
+
+        :rtype: :class:`Future`
+        """
+
+        future: Future = Future()
+        self._pending.setdefault(service, []).append((params, future))
+
+        return future
+
+    @contextmanager
+    def batched(self) -> Iterator["Bravia"]:
+        """
+        Queue every call made inside the block and send them
+        as one JSON-RPC batch per service when it exits.
+        Calls return a :class:`Future` that is resolved once
+        the block exits. If posting the batch of one service
+        fails, its calls, and those of the services not sent
+        yet, raise that error, while batches already answered
+        keep their results. Only calls made by the thread that
+        opened the block are queued, other threads using the
+        same instance are not affected. Setters that normally
+        read the current state first, e.g.
+        :meth:`set_power_saving_mode`, are queued without that
+        read, so a batch of writes costs a single round trip per
+        service.
+
+        Usage:
+
+        >>> with b.batched() as batch:
+        ...     power = batch.power_status
+        ...     network = batch.network_settings
+        >>> power.result(), network.result()
+        """
+
+        if self._pending is not None:
+            # Nested blocks join the outer batch.
+            yield self
+            return
+
+        self._local.pending = {}
+
+        try:
+            yield self
+        except BaseException:
+            for queued in self._local.pending.values():
+                for _, future in queued:
+                    future.cancel()
+            raise
+        finally:
+            pending, self._local.pending = self._local.pending, None
+
+        # Resolve each service as soon as its batch is answered, so that
+        # a failed post does not report calls the TV already ran as failed.
+        error: Optional[BaseException] = None
+
+        for service, queued in pending.items():
+            if error is None:
+                bodies = [params for params, _ in queued]
+
+                try:
+                    results = self._post_batches({service: bodies})
+                except BaseException as exc:
+                    error = exc
+                else:
+                    for params, future in queued:
+                        future.set_result(results.get(params["id"], []))
+                    continue
+
+            for _, future in queued:
+                future.set_exception(error)
+
+        if error is not None:
+            raise error
+
+    @contextmanager
+    def _unbatched(self) -> Iterator[None]:
+        """
+        Send calls made inside the block right away, even
+        inside a :meth:`batched` block.
+        """
+
+        pending, self._local.pending = self._pending, None
+
+        try:
+            yield
+        finally:
+            self._local.pending = pending
+
+    def system_snapshot(self) -> Dict[str, List[dict]]:
+        """
+        Get the commonly read ``system`` information
+        with a single request.
+
+        :return: Results keyed by method name
+        :rtype: Dict[str, List[dict]]
+        """
+
+        results = self.batch(_SNAPSHOT)
+
+        return {call[1]: result for call, result in zip(_SNAPSHOT, results)}
 
     def api_info(self, service=None) -> List[dict]:
         """
@@ -118,46 +647,52 @@ class Bravia:
         :rtype: List[dict]
         """
 
-        if not service:
-            services = [
-                {
-                    "services": [
-                        "appControl",
-                        "audio",
-                        "avContent",
-                        "encryption",
-                        "system",
-                        "video",
-                        "videoScreen",
-                    ]
-                }
-            ]
-        else:
-            services = [{"services": [service]}]
+        services = [{"services": [service] if service else list(_API_SERVICES)}]
 
-        prepared_params = self.build_params(
-            method="getSupportedApiInfo", params=services, version="1.0"
-        )
-        resp = self._get(params=prepared_params, service="guide")
+        return self._rpc("guide", "getSupportedApiInfo", params=services, cached=True)
 
-        return resp
+    def supports(self, method: str, service: str) -> bool:
+        """
+        Check whether the TV offers a method. The answer comes
+        from :meth:`api_info`, so only the first check of a
+        service is sent to the TV. Inside :meth:`batched` the
+        check is not queued, it is answered right away.
 
-    @staticmethod
-    def _rand_id() -> int:
+        :param method: Name of the method, e.g. ``setLEDIndicatorStatus``
+        :type method: :class:`str`
+        :param service: Name of the service
+        :type service: :class:`str`
+
+        :return: False if the TV does not list the method, or its
+            API information could not be read
+        :rtype: bool
+        """
+
+        with self._unbatched():
+            info = self.api_info(service=service)
+
+        try:
+            return any(
+                api["name"] == method
+                for entry in info[0]
+                for api in entry.get("apis", [])
+            )
+        except (LookupError, TypeError, AttributeError):
+            return False
+
+    def _rand_id(self) -> int:
         """
         The Bravia TV API uses a customized JSON RPC
-        protocol, which reserves the 'id' value 0. We
-        start with 1.
+        protocol, which reserves the 'id' value 0. Ids
+        come from a per-instance counter with a random
+        starting point, so they never repeat within a
+        batch.
 
-        :return: Random integer in designated range
+        :return: Integer in the range 1 to 2147483647
         :rtype: int
         """
 
-        rand_min: int = 1
-        rand_max: int = 2147483647
-        tx_id: int = randint(rand_min, rand_max)
-
-        return tx_id
+        return next(self._id_iter) & 0x7FFFFFFF
 
     @property
     def wol_mode(self) -> dict:
@@ -167,10 +702,7 @@ class Bravia:
         :rtype: dict
         """
 
-        prepared_params = self.build_params(method="getWolMode")
-        resp = self._get(params=prepared_params, service="system")
-
-        return resp
+        return self._rpc(*_READS["wol_mode"])
 
     def set_wol_mode(self, mode: bool) -> dict:
         """
@@ -197,10 +729,7 @@ class Bravia:
         :rtype: List[dict]
         """
 
-        prepared_params = self.build_params(method="getSystemInformation")
-        resp: Response = self._get(params=prepared_params, service="system")
-
-        return resp
+        return self._rpc(*_READS["system_info"], cached=True)
 
     @property
     def network_settings(self) -> List[dict]:
@@ -210,12 +739,7 @@ class Bravia:
         :rtype: List[dict]
         """
 
-        prepared_params = self.build_params(
-            method="getNetworkSettings", params=[{"netif": ""}]
-        )
-        resp: Response = self._get(params=prepared_params, service="system")
-
-        return resp
+        return self._rpc(*_READS["network_settings"], cached=True, ttl=60)
 
     @property
     def interface_information(self) -> List[dict]:
@@ -225,10 +749,7 @@ class Bravia:
         :rtype: List[dict]
         """
 
-        prepared_params = self.build_params(method="getInterfaceInformation")
-        resp: Response = self._get(params=prepared_params, service="system")
-
-        return resp
+        return self._rpc(*_READS["interface_information"], cached=True)
 
     @property
     def power_status(self) -> List[dict]:
@@ -238,10 +759,7 @@ class Bravia:
         :rtype: List[dict]
         """
 
-        prepared_params = self.build_params(method="getPowerStatus")
-        resp: List[dict] = self._get(params=prepared_params, service="system")
-
-        return resp
+        return self._rpc(*_READS["power_status"])
 
     @property
     def supported_functions(self) -> List[dict]:
@@ -251,40 +769,47 @@ class Bravia:
         :rtype: List[dict]
         """
 
-        prepared_params = self.build_params(method="getSystemSupportedFunction")
-        resp: List[dict] = self._get(params=prepared_params, service="system")
+        return self._rpc(*_READS["supported_functions"], cached=True)
 
-        return resp
-
-    def power_on(self) -> list:
+    def set_power_status(self, status: Union[bool, str]) -> list:
         """
-        Power on the TV.
+        Power the TV on or off. ``True``, ``"on"``, ``"true"`` and
+        ``"1"`` power it on, anything else powers it off. The TV
+        ignores a request for the state it is already in, so the
+        current state is not read first.
+
+        :param status: Requested power state
+        :type status: :class:`Union[bool, str]`
 
         :rtype: list
         """
 
         prepared_params = self.build_params(
             method="setPowerStatus",
-            params=[{"status": True}],
+            params=[{"status": status in _STATUS_TRUE}],
         )
         resp: List[dict] = self._set(params=prepared_params, service="system")
+        self.invalidate_cache()
 
         return resp
 
-    def power_off(self) -> list:
+    def power_on(self) -> list:
         """
         Power on the TV.
 
         :rtype: list
         """
 
-        prepared_params = self.build_params(
-            method="setPowerStatus",
-            params=[{"status": False}],
-        )
-        resp: List[dict] = self._set(params=prepared_params, service="system")
+        return self.set_power_status(True)
 
-        return resp
+    def power_off(self) -> list:
+        """
+        Power off the TV.
+
+        :rtype: list
+        """
+
+        return self.set_power_status(False)
 
     @property
     def power_saving_mode(self) -> dict:
@@ -294,12 +819,9 @@ class Bravia:
         :rtype: dict
         """
 
-        prepared_params = self.build_params(method="getPowerSavingMode")
-        resp: List[dict] = self._get(params=prepared_params, service="system")
-
-        return resp
+        return self._rpc(*_READS["power_saving_mode"])
 
-    def set_power_saving_mode(self, mode: str) -> List[dict]:
+    def set_power_saving_mode(self, mode: str, force: bool = False) -> List[dict]:
         """
         Set the power saving mode.
 
@@ -312,20 +834,25 @@ class Bravia:
 
         :param mode: Power saving mode
         :type mode: :class:`str`
+        :param force: Send the request even if the mode is already set
+        :type force: :class:`bool`
 
         :rtype: dict
         """
 
-        if self.power_saving_mode == mode:
-            return {"msg": f"Power saving mode already set to {mode}."}
-
         prepared_params = self.build_params(
             method="setPowerSavingMode",
             params=[{"mode": mode}],
         )
-        resp: List[dict] = self._get(params=prepared_params, service="system")
 
-        return resp
+        return self._maybe_set(
+            prepared_params,
+            service="system",
+            getter="getPowerSavingMode",
+            matches=lambda current: current[0]["mode"] == mode,
+            msg=lambda: f"Power saving mode already set to {mode}.",
+            force=force,
+        )
 
     @property
     def led_status(self) -> List[dict]:
@@ -335,12 +862,9 @@ class Bravia:
         :rtype: List[dict]
         """
 
-        prepared_params = self.build_params(method="getLEDIndicatorStatus")
-        resp: List[dict] = self._get(params=prepared_params, service="system")
+        return self._rpc(*_READS["led_status"])
 
-        return resp
-
-    def set_led_status(self, mode: str, status: bool) -> dict:
+    def set_led_status(self, mode: str, status: bool, force: bool = False) -> dict:
         """
         Set the LED indicator mode.
 
@@ -356,21 +880,27 @@ class Bravia:
         :type mode: :class:`str`
         :param status: True or False.
         :type status: :class:`bool`
+        :param force: Send the request even if the mode is already set
+        :type force: :class:`bool`
 
         :rtype: dict
         """
 
-        if self.led_status == mode and self.led_status.status is True:
-            return {"msg": f"LED already set to {mode}."}
-
         prepared_params = self.build_params(
             method="setLEDIndicatorStatus",
             params=[{"mode": mode, "status": status}],
             version="1.1",
         )
-        resp: List[dict] = self._set(params=prepared_params, service="system")
 
-        return resp
+        return self._maybe_set(
+            prepared_params,
+            service="system",
+            getter="getLEDIndicatorStatus",
+            matches=lambda current: current[0]["mode"] == mode
+            and (current[0]["status"] in _STATUS_TRUE) == (status in _STATUS_TRUE),
+            msg=lambda: f"LED already set to {mode}.",
+            force=force,
+        )
 
     def set_language(self, lang: str = "eng") -> dict:
         """
@@ -388,6 +918,7 @@ class Bravia:
             params=[{"language": lang}],
         )
         resp: List[dict] = self._set(params=prepared_params, service="system")
+        self.invalidate_cache()
 
         return resp
 
@@ -400,5 +931,6 @@ class Bravia:
 
         prepared_params = self.build_params(method="requestReboot")
         resp: List[dict] = self._set(params=prepared_params, service="system")
+        self.invalidate_cache()
 
         return resp
@@ -0,0 +1,263 @@
+"""
+bravia.transport
+~~~~~~~~~~~~~~~~
+
+HTTP sessions used by :class:`Bravia`.
+
+Every session has a ``headers`` mapping sent with each request, a
+``post(url, data=..., timeout=...)`` method taking the encoded JSON
+body and returning an object with
+``status_code`` and ``content``, and a ``close()`` method.
+:class:`requests.Session` is used as is.
+"""
+
+import http.client
+import threading
+import warnings
+from io import BytesIO
+from typing import Dict, Tuple, Union
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+TRANSPORTS = ("requests", "httpx", "http.client", "pycurl")
+
+
+class HttpxSession:
+    """
+    Session backed by an :class:`httpx.Client`. HTTP/2 is
+    negotiated when the ``h2`` package is installed.
+    """
+
+    def __init__(self):
+        import httpx
+
+        try:
+            import h2  # noqa: F401
+
+            http2 = True
+        except ImportError:
+            http2 = False
+
+        self._client = httpx.Client(
+            http2=http2,
+            limits=httpx.Limits(max_keepalive_connections=4, max_connections=8),
+        )
+        self._timeout_type = httpx.Timeout
+        self.headers = self._client.headers
+        self.headers["Content-Type"] = "application/json"
+        self.headers["Connection"] = "keep-alive"
+
+    def post(
+        self,
+        url: str,
+        data: bytes = b"",
+        timeout: Union[float, Tuple[float, float], None] = None,
+    ):
+        if isinstance(timeout, tuple):
+            connect, read = timeout
+            timeout = self._timeout_type(read, connect=connect)
+
+        return self._client.post(url, content=data, timeout=timeout)
+
+    def close(self) -> None:
+        self._client.close()
+
+
+class RawResponse:
+    """
+    Response returned by :class:`HTTPConnectionSession`.
+    """
+
+    __slots__ = ("status_code", "content")
+
+    def __init__(self, status_code: int, content: bytes):
+        self.status_code = status_code
+        self.content = content
+
+
+class HTTPConnectionSession:
+    """
+    Session that keeps one :class:`http.client.HTTPConnection`
+    per host and writes requests to it directly, bypassing the
+    adapter and hook machinery of ``requests``. A connection
+    that fails is dropped. A request that fails because the TV
+    closed an idle connection is retried once on a new one.
+    """
+
+    def __init__(self):
+        self.headers: Dict[str, str] = {
+            "Content-Type": "application/json",
+            "Connection": "keep-alive",
+        }
+        self._conns: Dict[str, http.client.HTTPConnection] = {}
+        self._targets: Dict[str, Tuple[str, str]] = {}
+        self._lock = threading.Lock()
+
+    def _target(self, url: str) -> Tuple[str, str]:
+        target = self._targets.get(url)
+
+        if target is None:
+            parts = urlsplit(url)
+            target = self._targets[url] = (parts.netloc, parts.path or "/")
+
+        return target
+
+    def post(
+        self,
+        url: str,
+        data: bytes = b"",
+        timeout: Union[float, Tuple[float, float], None] = None,
+    ) -> RawResponse:
+        host, path = self._target(url)
+
+        if isinstance(timeout, tuple):
+            timeout = max(timeout)
+
+        with self._lock:
+            while True:
+                conn = self._conns.get(host)
+                reused = conn is not None
+
+                if not reused:
+                    conn = self._conns[host] = http.client.HTTPConnection(host)
+
+                # Apply the timeout of this request, a kept-alive
+                # connection still has the one it was opened with.
+                conn.timeout = timeout
+
+                if conn.sock is not None:
+                    conn.sock.settimeout(timeout)
+
+                try:
+                    conn.request("POST", path, body=data, headers=self.headers)
+                    resp = conn.getresponse()
+
+                    return RawResponse(resp.status, resp.read())
+                except BaseException as exc:
+                    # The connection is in an unknown state, never reuse it.
+                    conn.close()
+                    del self._conns[host]
+
+                    # Only a kept-alive connection the TV closed while idle is
+                    # retried. A request that failed on a new connection may
+                    # already have run and is not sent twice.
+                    stale = isinstance(
+                        exc, (http.client.BadStatusLine, ConnectionError)
+                    )
+
+                    if not (reused and stale):
+                        raise
+
+    def close(self) -> None:
+        with self._lock:
+            for conn in self._conns.values():
+                conn.close()
+
+            self._conns.clear()
+
+
+class CurlSession:
+    """
+    Session backed by one long-lived :class:`pycurl.Curl` handle,
+    which keeps the connection to the TV open between requests.
+    """
+
+    def __init__(self):
+        import pycurl
+
+        self._pycurl = pycurl
+        self._curl = pycurl.Curl()
+        self._curl.setopt(pycurl.TCP_KEEPALIVE, 1)
+        self._curl.setopt(pycurl.FORBID_REUSE, 0)
+        # Empty means every encoding libcurl can decode, e.g. gzip.
+        self._curl.setopt(pycurl.ACCEPT_ENCODING, "")
+        self._lock = threading.Lock()
+        self.headers: Dict[str, str] = {
+            "Content-Type": "application/json",
+            "Connection": "keep-alive",
+        }
+
+    def post(
+        self,
+        url: str,
+        data: bytes = b"",
+        timeout: Union[float, Tuple[float, float], None] = None,
+    ) -> RawResponse:
+        pycurl = self._pycurl
+        buf = BytesIO()
+
+        if isinstance(timeout, tuple):
+            connect, total = timeout[0], sum(timeout)
+        else:
+            connect = total = timeout
+
+        with self._lock:
+            curl = self._curl
+            curl.setopt(pycurl.URL, url)
+            curl.setopt(pycurl.POSTFIELDS, data)
+            curl.setopt(
+                pycurl.HTTPHEADER, [f"{k}: {v}" for k, v in self.headers.items()]
+            )
+            curl.setopt(pycurl.WRITEDATA, buf)
+            curl.setopt(pycurl.CONNECTTIMEOUT_MS, int((connect or 0) * 1000))
+            curl.setopt(pycurl.TIMEOUT_MS, int((total or 0) * 1000))
+            curl.perform()
+
+            return RawResponse(curl.getinfo(pycurl.RESPONSE_CODE), buf.getvalue())
+
+    def close(self) -> None:
+        with self._lock:
+            self._curl.close()
+
+
+def make_session(transport: str = "requests", pool_maxsize: int = 16):
+    """
+    Create the HTTP session for the given transport. Falls back
+    to ``requests`` when the library for ``transport`` is not
+    installed.
+
+    :param transport: One of :data:`TRANSPORTS`
+    :type transport: :class:`str`
+    :param pool_maxsize: Connections the ``requests`` adapter keeps
+        open per host, defaults to :class:`16`
+    :type pool_maxsize: :class:`int`
+    """
+
+    if transport not in TRANSPORTS:
+        raise ValueError(
+            f"Unknown transport {transport!r}, expected one of {TRANSPORTS}."
+        )
+
+    if transport == "httpx":
+        # Imported here so that importing bravia does not pay for httpx.
+        try:
+            return HttpxSession()
+        except ImportError:
+            warnings.warn("httpx is not installed, falling back to requests.")
+
+    if transport == "http.client":
+        return HTTPConnectionSession()
+
+    if transport == "pycurl":
+        try:
+            return CurlSession()
+        except ImportError:
+            warnings.warn("pycurl is not installed, falling back to requests.")
+
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=pool_maxsize,
+        # Only failures to connect are retried. Every call is a POST, and
+        # a setter that reached the TV must not be sent twice.
+        max_retries=Retry(total=3, connect=3, read=False, backoff_factor=0.2),
+    )
+    session = requests.Session()
+    session.headers["Content-Type"] = "application/json"
+    session.headers["Connection"] = "keep-alive"
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+
+    return session
@@ -1,7 +1,149 @@
-from typing import List
+import json
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
 
 from requests import Response
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+_ENVELOPES: Dict[Tuple[str, str], dict] = {}
+_ENCODED_PREFIXES: Dict[Tuple[str, str], bytes] = {}
+_ENVELOPE_KEYS = frozenset({"method", "id", "params", "version"})
+
+
+class BraviaError(RuntimeError):
+    """
+    Raised when the TV answers a call with a JSON-RPC error
+    where no result can be returned in its place.
+
+    :param status_code: HTTP status code of the response
+    :type status_code: :class:`int`
+    :param error: ``error`` member of the response, usually
+        ``[code, message]``
+    :type error: :class:`list`
+    """
+
+    def __init__(self, status_code: int, error: list):
+        super().__init__(f"HTTP {status_code}: {error}")
+        self.status_code = status_code
+        self.error = error
+
+
+class ErrorResult(list):
+    """
+    The ``error`` member of a response, returned in place of
+    the result when the TV answered with an error or a status
+    other than 200. Compares equal to a plain list, so callers
+    can keep checking the returned value as before.
+    """
+
+
+def build_envelope(
+    method: str, tx_id: int, params: Optional[list] = None, version: str = "1.0"
+) -> dict:
+    """
+    Build a JSON-RPC request body. The static part of
+    the body is built once per method and version.
+
+    :param method: Name of the method
+    :type method: :class:`str`
+    :param tx_id: Request id
+    :type tx_id: :class:`int`
+    :param params: Optionally provided params, defaults to :class:`[]`
+    :type params: :class:`Optional[list]`
+    :param version: Version of the method to use, defaults to 1.0
+    :type version: :class:`str`
+
+    :rtype: :class:`dict`
+    """
+
+    key = (method, version)
+    template = _ENVELOPES.get(key)
+
+    if template is None:
+        template = _ENVELOPES[key] = {"method": method, "version": version}
+
+    return {**template, "id": tx_id, "params": params if params is not None else []}
+
+
+def dumps(obj: Any) -> bytes:
+    """
+    Encode a request body, using ``orjson`` when
+    it is installed.
+
+    :param obj: Request body
+    :type obj: :class:`Any`
+
+    :rtype: :class:`bytes`
+    """
+
+    if orjson is not None:
+        return orjson.dumps(obj)
+
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+def encode_request(body: Any) -> bytes:
+    """
+    Encode a request body. Envelopes without params, which
+    is most getters, are encoded once per method and version
+    and only the id is spliced in on each call.
+
+    :param body: Request body or list of request bodies
+    :type body: :class:`Any`
+
+    :rtype: :class:`bytes`
+    """
+
+    if not isinstance(body, dict) or body.keys() != _ENVELOPE_KEYS or body["params"]:
+        return dumps(body)
+
+    key = (body["method"], body["version"])
+    prefix = _ENCODED_PREFIXES.get(key)
+
+    if prefix is None:
+        encoded = dumps({"method": key[0], "params": [], "version": key[1]})
+        prefix = _ENCODED_PREFIXES[key] = encoded[:-1] + b',"id":'
+
+    return b"%s%d}" % (prefix, body["id"])
+
+
+def loads(data: bytes) -> Any:
+    """
+    Decode a JSON response body, using ``orjson``
+    when it is installed.
+
+    :param data: Raw response body
+    :type data: :class:`bytes`
+    """
+
+    if orjson is not None:
+        return orjson.loads(data)
+
+    return json.loads(data)
+
+
+def parse_result(status_code: int, body: dict) -> List[dict]:
+    """
+    Return the error or the result from a decoded
+    response body. Errors are returned as :class:`ErrorResult`.
+
+    :param status_code: HTTP status code of the response
+    :type status_code: :class:`int`
+    :param body: Decoded JSON body of the response
+    :type body: :class:`dict`
+
+    :rtype: List[dict]
+    """
+
+    # JSON-RPC errors are usually sent with a 200 status.
+    if "error" in body or not status_code == 200:
+        return ErrorResult(body.get("error", []))
+
+    return body.get("result", [])
+
 
 def handle_error(resp: Response) -> List[dict]:
     """
@@ -14,7 +156,59 @@ def handle_error(resp: Response) -> List[dict]:
     :rtype: List[dict]
     """
 
-    if not resp.status_code == 200:
-        return resp.json().get("error", [])
+    return parse_result(resp.status_code, loads(resp.content))
+
+
+def group_calls(
+    calls: Iterable[tuple], build_params: Callable[..., dict]
+) -> Tuple[Dict[str, List[dict]], List[int]]:
+    """
+    Build the request body of each call and group the bodies
+    by service, one JSON-RPC batch per service.
+
+    :param calls: ``(service, method, params)`` or
+        ``(service, method, params, version)`` tuples, the
+        version defaults to 1.0
+    :type calls: :class:`Iterable[tuple]`
+    :param build_params: ``build_params`` of the client
+    :type build_params: :class:`Callable[..., dict]`
+
+    :return: Bodies keyed by service, and the request ids in call order
+    :rtype: Tuple[Dict[str, List[dict]], List[int]]
+    """
+
+    grouped: Dict[str, List[dict]] = {}
+    ids: List[int] = []
+
+    for service, method, params, *version in calls:
+        body = build_params(
+            method=method, params=params, version=version[0] if version else "1.0"
+        )
+        grouped.setdefault(service, []).append(body)
+        ids.append(body["id"])
+
+    return grouped, ids
+
+
+def parse_batch(
+    status_code: int, data: Union[dict, list], bodies: List[dict]
+) -> Dict[int, List[dict]]:
+    """
+    Return the result or error of each request of a batch.
+
+    :param status_code: HTTP status code of the response
+    :type status_code: :class:`int`
+    :param data: Decoded JSON body of the response
+    :type data: :class:`Union[dict, list]`
+    :param bodies: Request bodies of the batch
+    :type bodies: :class:`List[dict]`
+
+    :return: Results keyed by request id
+    :rtype: Dict[int, List[dict]]
+    """
+
+    if isinstance(data, dict):
+        # The whole batch was rejected.
+        return {body["id"]: parse_result(status_code, data) for body in bodies}
 
-    return resp.json().get("result", [])
+    return {item.get("id"): parse_result(status_code, item) for item in data}
@@ -7,7 +7,7 @@ Module for the video service.
 
 from typing import List
 
-from bravia import Bravia
+from .bravia import Bravia
 
 
 class Video(Bravia):
@@ -16,8 +16,7 @@ class Video(Bravia):
     service.
     """
 
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
+    __slots__ = ()
 
     @property
     def picture_quality_settings(self, target=None) -> List[dict]:
@@ -27,13 +26,11 @@ class Video(Bravia):
         :rtype: List[dict]
         """
 
-        prepared_params = self.build_params(
-            method="getPictureQualitySettings",
+        return self._rpc(
+            "video",
+            "getPictureQualitySettings",
             params=[{"target": target}] if target else [{"target": ""}],
         )
-        resp: List[dict] = self._get(params=prepared_params, service="video")
-
-        return resp
 
     def set_picture_quality_settings(self, **kwargs) -> List[dict]:
         """
@@ -2,12 +2,20 @@
 Basic tests.
 """
 
+import asyncio
+import json
+import threading
+import time
+from contextlib import asynccontextmanager
 from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
 from typing import Optional
 
 import pytest
 
-from bravia import Bravia, AppControl, AudioControl, AvContent, Video
+from bravia import Bravia, AppControl, AudioControl, AvContent, BraviaError, Video
+from bravia.utils import ErrorResult, encode_request, handle_error
 
 
 @dataclass
@@ -21,6 +29,162 @@ def config_fixture():
     return ConfigFixture(ip="192.168.50.218", pre_shared_key="meseeks")
 
 
+class FakeResponse:
+    def __init__(self, body, status_code=200):
+        self.body = body
+        self.status_code = status_code
+
+    @property
+    def content(self):
+        return json.dumps(self.body).encode()
+
+
+def answer(body):
+    """
+    Answer each request with its method name, in reverse order
+    for batches.
+    """
+
+    if isinstance(body, list):
+        return [answer(item) for item in reversed(body)]
+
+    return {"result": [body["method"]], "id": body["id"]}
+
+
+class FakeSession:
+    """
+    Stands in for the HTTP session of a client. Records the
+    URL and decoded body of every post and answers it with
+    ``reply``, which returns a response body or a
+    :class:`FakeResponse`.
+    """
+
+    def __init__(self, monkeypatch):
+        self.monkeypatch = monkeypatch
+        self.reply = answer
+        self.urls = []
+        self.bodies = []
+
+    def attach(self, client, reply=None):
+        if reply is not None:
+            self.reply = reply
+
+        self.monkeypatch.setattr(client._session, "post", self.post)
+
+        return client
+
+    def post(self, url, data, **kwargs):
+        body = json.loads(data)
+        self.urls.append(url)
+        self.bodies.append(body)
+        resp = self.reply(body)
+
+        return resp if isinstance(resp, FakeResponse) else FakeResponse(resp)
+
+    @property
+    def methods(self):
+        return [body["method"] for body in self.bodies]
+
+
+@pytest.fixture
+def fake_session(monkeypatch):
+    return FakeSession(monkeypatch)
+
+
+class TVHandler(BaseHTTPRequestHandler):
+    """
+    Answers JSON-RPC posts like :func:`answer`. The next entry
+    of ``server.actions`` changes how one request is handled:
+    ``stall`` answers too late, ``close`` closes the connection
+    after answering without saying so, and ``drop`` closes it
+    without answering.
+    """
+
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        self.server.requests.append((self.path, body, self.headers))
+        action = self.server.actions.pop(0) if self.server.actions else None
+
+        if action == "drop":
+            self.close_connection = True
+            return
+
+        if action == "stall":
+            time.sleep(0.5)
+
+        data = json.dumps(answer(body)).encode()
+
+        try:
+            self.send_response(self.server.status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+        except OSError:
+            # The client gave up waiting.
+            self.close_connection = True
+
+        if action == "close":
+            self.close_connection = True
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def tv_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), TVHandler)
+    server.requests = []
+    server.actions = []
+    server.status = 200
+    server.ip = f"127.0.0.1:{server.server_address[1]}"
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    yield server
+
+    server.shutdown()
+    server.server_close()
+
+
+@asynccontextmanager
+async def aio_tv(delay=0):
+    """
+    Serve JSON-RPC posts like :func:`answer` on a local
+    ``aiohttp`` server, each after ``delay`` seconds. Yields
+    the recorded paths and bodies, and the highest number of
+    requests that were handled at once.
+    """
+
+    web = pytest.importorskip("aiohttp.web")
+    tv = SimpleNamespace(paths=[], bodies=[], active=0, peak=0)
+
+    async def handler(request):
+        body = await request.json()
+        tv.paths.append(request.path)
+        tv.bodies.append(body)
+        tv.active += 1
+        tv.peak = max(tv.peak, tv.active)
+        await asyncio.sleep(delay)
+        tv.active -= 1
+
+        return web.json_response(answer(body))
+
+    app = web.Application()
+    app.router.add_post("/sony/{service}", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    tv.ip = f"127.0.0.1:{site._server.sockets[0].getsockname()[1]}"
+
+    try:
+        yield tv
+    finally:
+        await runner.cleanup()
+
+
 def test_create_bravia(config_fixture):
     b = Bravia(ip=config_fixture.ip, pre_shared_key=config_fixture.pre_shared_key)
     assert isinstance(b, Bravia)
@@ -44,3 +208,662 @@ def test_create_av_content(config_fixture):
 def test_create_video(config_fixture):
     b = Video(ip=config_fixture.ip, pre_shared_key=config_fixture.pre_shared_key)
     assert isinstance(b, Video)
+
+
+def test_bravia_context_manager(config_fixture):
+    with Bravia(
+        ip=config_fixture.ip, pre_shared_key=config_fixture.pre_shared_key
+    ) as b:
+        assert isinstance(b, Bravia)
+
+
+def test_create_async_bravia(config_fixture):
+    aio = pytest.importorskip("bravia.aio")
+    b = aio.AsyncBravia(
+        ip=config_fixture.ip, pre_shared_key=config_fixture.pre_shared_key
+    )
+    assert isinstance(b, aio.AsyncBravia)
+
+
+def test_async_bravia_context_manager_closes_session(config_fixture):
+    aio = pytest.importorskip("bravia.aio")
+
+    async def main():
+        async with aio.AsyncBravia(ip=config_fixture.ip) as b:
+            session = b._get_session()
+
+        return session
+
+    assert asyncio.run(main()).closed
+
+
+def test_async_bravia_from_session_leaves_session_open(config_fixture):
+    aio = pytest.importorskip("bravia.aio")
+
+    async def main():
+        async with aio.aiohttp.ClientSession() as session:
+            async with aio.AsyncBravia.from_session(config_fixture.ip, session):
+                pass
+
+            return session.closed
+
+    assert asyncio.run(main()) is False
+
+
+def test_async_service_classes_and_call():
+    aio = pytest.importorskip("bravia.aio")
+
+    async def main():
+        async with aio_tv() as tv:
+            async with aio.AsyncAudioControl(ip=tv.ip) as b:
+                volume = await b.volume_info()
+                apps = await b.call("appControl", "getApplicationList")
+
+        return tv, volume, apps
+
+    tv, volume, apps = asyncio.run(main())
+
+    assert volume == ["getVolumeInformation"]
+    assert apps == ["getApplicationList"]
+    assert tv.paths == ["/sony/audio", "/sony/appControl"]
+
+
+def test_async_batch_matches_sync_batch():
+    aio = pytest.importorskip("bravia.aio")
+    calls = [
+        ("system", "getPowerStatus", []),
+        ("audio", "getVolumeInformation", [], "1.1"),
+        ("system", "getWolMode", []),
+    ]
+
+    async def main():
+        async with aio_tv() as tv:
+            async with aio.AsyncBravia(ip=tv.ip) as b:
+                return tv, await b.batch(calls)
+
+    tv, results = asyncio.run(main())
+
+    assert results == [["getPowerStatus"], ["getVolumeInformation"], ["getWolMode"]]
+    assert sorted(tv.paths) == ["/sony/audio", "/sony/system"]
+
+
+def test_async_poll_yields_results_by_method():
+    aio = pytest.importorskip("bravia.aio")
+    specs = [
+        ("system", "getPowerStatus"),
+        ("audio", "getSoundSettings", [{"target": "outputTerminal"}], "1.1"),
+    ]
+
+    async def main():
+        async with aio_tv(delay=0.05) as tv:
+            async with aio.AsyncBravia(ip=tv.ip) as b:
+                polls = b.poll(specs, interval=0)
+                statuses = [await polls.__anext__(), await polls.__anext__()]
+                await polls.aclose()
+
+        return tv, statuses
+
+    tv, statuses = asyncio.run(main())
+
+    assert (
+        statuses
+        == [
+            {
+                "getPowerStatus": ["getPowerStatus"],
+                "getSoundSettings": ["getSoundSettings"],
+            }
+        ]
+        * 2
+    )
+    assert len(tv.bodies) == 4
+    sound = next(b for b in tv.bodies if b["method"] == "getSoundSettings")
+    assert sound["params"] == [{"target": "outputTerminal"}]
+    assert sound["version"] == "1.1"
+    assert tv.peak == 2
+
+
+def test_async_poll_rejects_repeated_method_names():
+    aio = pytest.importorskip("bravia.aio")
+    specs = [("system", "getPowerStatus"), ("audio", "getPowerStatus")]
+
+    async def main():
+        async with aio.AsyncBravia(ip="192.168.50.218") as b:
+            await b.poll(specs, interval=0).__anext__()
+
+    with pytest.raises(ValueError):
+        asyncio.run(main())
+
+
+def test_async_bulk_status_maps_names_concurrently():
+    aio = pytest.importorskip("bravia.aio")
+
+    async def main():
+        async with aio_tv(delay=0.05) as tv:
+            async with aio.AsyncBravia(ip=tv.ip) as b:
+                return tv, await b.bulk_status()
+
+    tv, status = asyncio.run(main())
+
+    assert status == {name: [aio._READS[name][1]] for name in aio._BULK_STATUS}
+    assert len(tv.bodies) == len(aio._BULK_STATUS)
+    assert tv.peak > 1
+
+
+def test_sync_and_async_reads_send_the_shared_specs(config_fixture, fake_session):
+    aio = pytest.importorskip("bravia.aio")
+
+    for name, (service, method, params, version) in aio._READS.items():
+        sync_cls = next(c for c in (AudioControl, AvContent) if hasattr(c, name))
+        getattr(fake_session.attach(sync_cls(ip=config_fixture.ip)), name)
+
+        assert fake_session.urls[-1].endswith(f"/sony/{service}")
+        assert fake_session.bodies[-1]["method"] == method
+        assert fake_session.bodies[-1]["params"] == (params or [])
+        assert fake_session.bodies[-1]["version"] == version
+
+    async_names = [
+        name
+        for name in aio._READS
+        if hasattr(aio.AsyncAudioControl, name) or hasattr(aio.AsyncAvContent, name)
+    ]
+    assert async_names == list(aio._READS)
+
+
+def test_async_gather_status_maps_names_concurrently():
+    aio = pytest.importorskip("bravia.aio")
+
+    async def main():
+        async with aio_tv(delay=0.05) as tv:
+            async with aio.AsyncBravia(ip=tv.ip) as b:
+                return tv, await aio.gather_status(b)
+
+    tv, status = asyncio.run(main())
+
+    assert status == {
+        "power_status": ["getPowerStatus"],
+        "network_settings": ["getNetworkSettings"],
+        "led_status": ["getLEDIndicatorStatus"],
+        "supported_functions": ["getSystemSupportedFunction"],
+        "volume_info": ["getVolumeInformation"],
+        "app_list": ["getApplicationList"],
+    }
+    assert tv.peak == 6
+
+
+@pytest.mark.parametrize("reject", [False, True])
+def test_async_bravia_subscribe_yields_notifications(reject):
+    aio = pytest.importorskip("bravia.aio")
+    web = pytest.importorskip("aiohttp.web")
+    switched = []
+
+    async def handler(request):
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+
+        for _ in range(2):
+            body = json.loads(await ws.receive_str())
+            switched.append(body["params"])
+
+            if reject:
+                error = [40200, "Service Not Available"]
+                await ws.send_str(json.dumps({"error": error, "id": body["id"]}))
+                await ws.receive()
+                return ws
+
+            result = [{"enabled": [], "disabled": [{"name": "notifyPowerStatus"}]}]
+            await ws.send_str(json.dumps({"result": result, "id": body["id"]}))
+
+        await ws.send_str(
+            json.dumps({"method": "notifyPowerStatus", "params": [{"status": "on"}]})
+        )
+        await ws.close()
+
+        return ws
+
+    async def main():
+        app = web.Application()
+        app.router.add_get("/sony/system", handler)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+
+        try:
+            async with aio.AsyncBravia(ip=f"127.0.0.1:{port}") as b:
+                return [e async for e in b.subscribe("system")]
+        finally:
+            await runner.cleanup()
+
+    if reject:
+        with pytest.raises(BraviaError) as excinfo:
+            asyncio.run(main())
+
+        assert excinfo.value.error == [40200, "Service Not Available"]
+        assert switched == [[{}]]
+        return
+
+    events = asyncio.run(main())
+
+    assert events == [{"method": "notifyPowerStatus", "params": [{"status": "on"}]}]
+    assert switched[1] == [{"enabled": [{"name": "notifyPowerStatus"}], "disabled": []}]
+
+
+def test_bravia_error_keeps_status_and_error():
+    err = BraviaError(200, [40005, "Display Is Turned off"])
+    assert isinstance(err, RuntimeError)
+    assert err.error == [40005, "Display Is Turned off"]
+    assert err.status_code == 200
+
+
+def test_batch_keeps_call_order(config_fixture, fake_session):
+    b = fake_session.attach(
+        Bravia(ip=config_fixture.ip, pre_shared_key=config_fixture.pre_shared_key)
+    )
+    results = b.batch(
+        [
+            ("system", "getPowerStatus", []),
+            ("audio", "getVolumeInformation", []),
+            ("system", "getWolMode", []),
+        ]
+    )
+
+    assert results == [["getPowerStatus"], ["getVolumeInformation"], ["getWolMode"]]
+    assert len(fake_session.urls) == 2
+
+
+def test_batch_sends_given_version(config_fixture, fake_session):
+    b = fake_session.attach(
+        Bravia(ip=config_fixture.ip, pre_shared_key=config_fixture.pre_shared_key)
+    )
+    b.batch(
+        [
+            ("audio", "getSoundSettings", [{"target": "outputTerminal"}], "1.1"),
+            ("audio", "getVolumeInformation", []),
+        ]
+    )
+
+    assert [body["version"] for body in fake_session.bodies[0]] == ["1.1", "1.0"]
+
+
+def test_api_info_is_cached(config_fixture, fake_session):
+    b = fake_session.attach(
+        Bravia(ip=config_fixture.ip, pre_shared_key=config_fixture.pre_shared_key)
+    )
+
+    assert b.api_info() == b.api_info() == ["getSupportedApiInfo"]
+    assert len(fake_session.bodies) == 1
+
+    b.invalidate_cache()
+    b.api_info()
+    assert len(fake_session.bodies) == 2
+
+
+def test_cached_results_are_copies(config_fixture, fake_session):
+    b = fake_session.attach(Bravia(ip=config_fixture.ip))
+
+    b.system_info.append("junk")
+    info = b.system_info
+    info.append("junk")
+
+    assert b.system_info == ["getSystemInformation"]
+    assert len(fake_session.bodies) == 1
+
+
+@pytest.mark.parametrize(
+    "reply",
+    [
+        {"error": [40005, "Display Is Turned off"], "id": 1},
+        FakeResponse({"result": [], "id": 1}, status_code=503),
+    ],
+)
+def test_errors_are_not_cached(config_fixture, fake_session, reply):
+    replies = [reply]
+    b = fake_session.attach(
+        Bravia(ip=config_fixture.ip),
+        lambda body: replies.pop(0) if replies else answer(body),
+    )
+
+    assert isinstance(b.interface_information, ErrorResult)
+    assert b.interface_information == ["getInterfaceInformation"]
+    assert b.interface_information == ["getInterfaceInformation"]
+    assert len(fake_session.bodies) == 2
+
+
+def test_concurrent_cached_calls_share_one_request(config_fixture, fake_session):
+    release = threading.Event()
+
+    def reply(body):
+        release.wait(5)
+        return answer(body)
+
+    b = fake_session.attach(
+        Bravia(ip=config_fixture.ip, pre_shared_key=config_fixture.pre_shared_key),
+        reply,
+    )
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(b.system_info)) for _ in range(4)
+    ]
+
+    for t in threads:
+        t.start()
+
+    while not fake_session.bodies:
+        release.wait(0.01)
+
+    release.set()
+
+    for t in threads:
+        t.join(5)
+
+    assert results == [["getSystemInformation"]] * 4
+    assert len(fake_session.bodies) == 1
+
+
+def test_invalidate_cache_discards_in_flight_result(config_fixture, fake_session):
+    release = threading.Event()
+
+    def reply(body):
+        release.wait(5)
+        return answer(body)
+
+    b = fake_session.attach(Bravia(ip=config_fixture.ip), reply)
+    reader = threading.Thread(target=lambda: b.system_info)
+    reader.start()
+
+    while not fake_session.bodies:
+        release.wait(0.01)
+
+    b.invalidate_cache()
+    release.set()
+    reader.join(5)
+
+    assert b.system_info == ["getSystemInformation"]
+    assert len(fake_session.bodies) == 2
+
+
+def test_supports_reads_api_info_once(config_fixture, fake_session):
+    apis = [{"name": "getLEDIndicatorStatus"}, {"name": "setLEDIndicatorStatus"}]
+    b = fake_session.attach(
+        Bravia(ip=config_fixture.ip),
+        lambda body: {
+            "result": [[{"service": "system", "apis": apis}]],
+            "id": body["id"],
+        },
+    )
+
+    assert b.supports("setLEDIndicatorStatus", "system")
+    assert not b.supports("setPowerSavingMode", "system")
+    assert len(fake_session.bodies) == 1
+
+
+def test_supports_is_answered_inside_batched(config_fixture, fake_session):
+    apis = [{"name": "getPowerStatus"}]
+
+    def reply(body):
+        if isinstance(body, list):
+            return answer(body)
+        return {"result": [[{"service": "system", "apis": apis}]], "id": body["id"]}
+
+    b = fake_session.attach(Bravia(ip=config_fixture.ip), reply)
+
+    with b.batched() as batch:
+        assert batch.supports("getPowerStatus", "system")
+        power = batch.power_status
+
+    assert power.result() == ["getPowerStatus"]
+    assert fake_session.bodies[0]["method"] == "getSupportedApiInfo"
+    assert [body["method"] for body in fake_session.bodies[1]] == ["getPowerStatus"]
+
+
+@pytest.mark.parametrize(
+    "status,expected",
+    [(True, True), ("on", True), ("1", True), (False, False), ("off", False)],
+)
+def test_set_power_status(config_fixture, fake_session, status, expected):
+    b = fake_session.attach(
+        Bravia(ip=config_fixture.ip, pre_shared_key=config_fixture.pre_shared_key)
+    )
+    b.set_power_status(status)
+
+    assert len(fake_session.bodies) == 1
+    assert fake_session.bodies[0]["params"] == [{"status": expected}]
+
+
+def test_unknown_transport(config_fixture):
+    with pytest.raises(ValueError):
+        Bravia(ip=config_fixture.ip, pre_shared_key=None, transport="carrier-pigeon")
+
+
+@pytest.mark.parametrize("transport,module", [("httpx", "httpx"), ("pycurl", "pycurl")])
+def test_transport_round_trip(tv_server, transport, module):
+    pytest.importorskip(module)
+    b = Bravia(ip=tv_server.ip, pre_shared_key="meseeks", transport=transport)
+
+    with b:
+        assert type(b._session).__module__ == "bravia.transport"
+        assert b.power_status == ["getPowerStatus"]
+        assert b.batch([("system", "getWolMode", [])]) == [["getWolMode"]]
+
+    path, body, headers = tv_server.requests[0]
+    assert path == "/sony/system"
+    assert body["method"] == "getPowerStatus"
+    assert headers["X-Auth-PSK"] == "meseeks"
+
+
+def test_http_client_transport_recovers_from_timeout(tv_server):
+    b = Bravia(ip=tv_server.ip, transport="http.client", timeout=0.2)
+    tv_server.actions = ["stall"]
+
+    with pytest.raises(TimeoutError):
+        b.power_status
+
+    assert b.power_status == ["getPowerStatus"]
+    assert b.power_status == ["getPowerStatus"]
+    assert len(tv_server.requests) == 3
+
+
+def test_http_client_transport_applies_timeout_to_kept_connection(tv_server):
+    b = Bravia(ip=tv_server.ip, transport="http.client", timeout=5)
+    assert b.power_status == ["getPowerStatus"]
+
+    b.timeout = 0.2
+    tv_server.actions = ["stall"]
+
+    with pytest.raises(TimeoutError):
+        b.power_status
+
+
+def test_http_client_transport_retries_stale_connection(tv_server):
+    b = Bravia(ip=tv_server.ip, transport="http.client")
+    tv_server.actions = ["close"]
+
+    assert b.power_status == ["getPowerStatus"]
+    assert b.power_status == ["getPowerStatus"]
+    # The retried request never reached the server on the stale connection.
+    assert len(tv_server.requests) == 2
+
+
+def test_http_client_transport_does_not_resend_on_new_connection(tv_server):
+    b = Bravia(ip=tv_server.ip, transport="http.client")
+    tv_server.actions = ["drop"]
+
+    with pytest.raises(ConnectionError):
+        b.reboot()
+
+    assert len(tv_server.requests) == 1
+    assert b.power_status == ["getPowerStatus"]
+
+
+def test_requests_transport_does_not_resend_on_error_status(tv_server):
+    tv_server.status = 503
+    b = Bravia(ip=tv_server.ip)
+
+    assert isinstance(b.power_status, ErrorResult)
+    assert len(tv_server.requests) == 1
+
+
+def test_pool_maxsize_is_passed_to_adapter(config_fixture):
+    b = Bravia(ip=config_fixture.ip, pool_maxsize=32)
+    assert b._session.get_adapter(b.base_url)._pool_maxsize == 32
+
+
+def test_prewarm_ignores_errors(config_fixture, fake_session):
+    def reply(body):
+        raise ConnectionError("TV is starting up")
+
+    fake_session.attach(Bravia(ip=config_fixture.ip), reply).prewarm()
+
+
+def test_prewarm_does_not_fill_the_cache(config_fixture, fake_session):
+    replies = [{"error": [40005, "Display Is Turned off"], "id": 1}]
+    b = fake_session.attach(
+        Bravia(ip=config_fixture.ip),
+        lambda body: replies.pop(0) if replies else answer(body),
+    )
+    b.prewarm()
+
+    assert b.interface_information == ["getInterfaceInformation"]
+    assert len(fake_session.bodies) == 2
+
+
+def test_batched_resolves_futures(config_fixture, fake_session):
+    b = fake_session.attach(AudioControl(ip=config_fixture.ip, pre_shared_key=None))
+
+    with b.batched() as batch:
+        power = batch.power_status
+        volume = batch.volume_info
+        wol = batch.wol_mode
+        assert not fake_session.bodies
+
+    assert len(fake_session.bodies) == 2
+    assert power.result() == ["getPowerStatus"]
+    assert volume.result() == ["getVolumeInformation"]
+    assert wol.result() == ["getWolMode"]
+
+
+def test_batched_keeps_results_of_services_sent_before_a_failure(
+    config_fixture, fake_session
+):
+    def reply(body):
+        if body[0]["method"] == "getVolumeInformation":
+            raise ConnectionError("TV went away")
+        return answer(body)
+
+    b = fake_session.attach(AudioControl(ip=config_fixture.ip), reply)
+
+    with pytest.raises(ConnectionError):
+        with b.batched() as batch:
+            saving = batch.set_power_saving_mode("low")
+            volume = batch.volume_info
+
+    assert saving.result() == ["setPowerSavingMode"]
+    with pytest.raises(ConnectionError):
+        volume.result()
+
+
+def test_batched_only_queues_calls_of_its_thread(config_fixture, fake_session):
+    b = fake_session.attach(Bravia(ip=config_fixture.ip))
+    results = []
+
+    with b.batched() as batch:
+        power = batch.power_status
+        other = threading.Thread(target=lambda: results.append(b.power_status))
+        other.start()
+        other.join(5)
+
+    assert results == [["getPowerStatus"]]
+    assert power.result() == ["getPowerStatus"]
+
+
+def test_handle_error_returns_rpc_error():
+    resp = FakeResponse({"error": [40005, "Display Is Turned off"], "id": 1})
+
+    assert handle_error(resp) == [40005, "Display Is Turned off"]
+
+
+def test_encode_request_matches_json():
+    b = Bravia(ip="192.168.50.218", pre_shared_key=None)
+
+    for body in (
+        b.build_params(method="getPowerStatus"),
+        b.build_params(method="getPowerStatus"),
+        b.build_params(method="setPowerStatus", params=[{"status": True}]),
+        [b.build_params(method="getWolMode")],
+    ):
+        assert json.loads(encode_request(body)) == body
+
+
+def test_cache_disabled_and_invalidated(config_fixture, fake_session):
+    b = fake_session.attach(
+        Bravia(ip=config_fixture.ip, pre_shared_key=None, cache_ttl=0)
+    )
+    b.system_info
+    b.system_info
+    assert len(fake_session.bodies) == 2
+
+    b.cache_ttl = 300
+    b.system_info
+    b.system_info
+    assert len(fake_session.bodies) == 3
+
+    b.set_language("eng")
+    b.system_info
+    assert len(fake_session.bodies) == 5
+
+
+def test_batched_setters_skip_state_check(config_fixture, fake_session):
+    b = fake_session.attach(Bravia(ip=config_fixture.ip, pre_shared_key=None))
+
+    with b.batched() as batch:
+        batch.set_power_saving_mode("low")
+        batch.set_led_status("Dark", True)
+        batch.set_wol_mode(True)
+
+    assert len(fake_session.bodies) == 1
+    assert [body["method"] for body in fake_session.bodies[0]] == [
+        "setPowerSavingMode",
+        "setLEDIndicatorStatus",
+        "setWolMode",
+    ]
+
+
+@pytest.mark.parametrize("reported", ["true", True])
+def test_set_led_status_skips_when_already_set(config_fixture, fake_session, reported):
+    b = fake_session.attach(
+        Bravia(ip=config_fixture.ip),
+        lambda body: {
+            "result": [{"mode": "Dark", "status": reported}],
+            "id": body["id"],
+        },
+    )
+
+    assert b.set_led_status("Dark", True) == {"msg": "LED already set to Dark."}
+    b.set_led_status("Dark", False)
+    assert fake_session.methods == ["getLEDIndicatorStatus", "setLEDIndicatorStatus"]
+
+
+def test_mute_skips_when_already_set(config_fixture, fake_session):
+    volume = [[{"target": "speaker", "volume": 10, "mute": True}]]
+
+    def reply(body):
+        result = volume if body["method"] == "getVolumeInformation" else []
+        return {"result": result, "id": body["id"]}
+
+    b = fake_session.attach(AudioControl(ip=config_fixture.ip), reply)
+
+    assert b.mute(True) == {"msg": "Mute already set to True."}
+    b.mute(False)
+    assert fake_session.methods == ["getVolumeInformation", "setAudioMute"]
+
+    b.mute(True, force=True)
+    assert fake_session.methods[-1] == "setAudioMute"
+    assert fake_session.methods.count("getVolumeInformation") == 1
+
+
+def test_create_bravia_without_pre_shared_key(config_fixture):
+    b = AppControl(ip=config_fixture.ip)
+    assert b.pre_shared_key is None
+    assert "X-Auth-PSK" not in b._session.headers